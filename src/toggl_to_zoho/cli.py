@@ -4,10 +4,39 @@ import sys
 import argparse
 import io
 from pathlib import Path
-from toggl_to_zoho.converter import convert_toggl_to_zoho
+from typing import TextIO, Union
+from toggl_to_zoho.converter import IO_BUFFER_SIZE, convert_toggl_to_zoho
 
 
-def main():
+def open_std_stream(stream: TextIO, mode: str, encoding: str) -> TextIO:
+    """Reopen a standard stream's file descriptor with a larger buffer.
+    
+    The descriptor is wrapped in a new FileIO with closefd=False, so closing
+    the returned stream leaves the original sys.stdin/sys.stdout usable.
+    
+    Args:
+        stream: sys.stdin or sys.stdout
+        mode: 'r' for input or 'w' for output
+        encoding: Text encoding for the returned stream
+        
+    Returns:
+        Buffered text stream, or the original stream if it has no file descriptor
+    """
+    try:
+        fd = stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        return stream
+    
+    raw = io.FileIO(fd, mode, closefd=False)
+    buffer: Union[io.BufferedReader, io.BufferedWriter]
+    if mode == 'r':
+        buffer = io.BufferedReader(raw, buffer_size=IO_BUFFER_SIZE)
+    else:
+        buffer = io.BufferedWriter(raw, buffer_size=IO_BUFFER_SIZE)
+    return io.TextIOWrapper(buffer, encoding=encoding, newline='')
+
+
+def main() -> None:
     """Main entry point for the CLI."""
     parser = argparse.ArgumentParser(
         description='Convert Toggl time tracking CSV exports to Zoho-compatible CSV format.',
@@ -70,24 +99,33 @@ def main():
     try:
         # Prepare input source
         if input_is_stdin:
-            # Use stdin directly (already a TextIOWrapper)
-            input_handle = sys.stdin
+            input_handle = open_std_stream(sys.stdin, 'r', 'utf-8-sig')
         else:
             input_handle = args.input
         
         # Prepare output destination  
         if output_is_stdout:
-            # Use stdout directly (already a TextIOWrapper)
-            output_handle = sys.stdout
+            sys.stdout.flush()
+            output_handle = open_std_stream(sys.stdout, 'w', 'utf-8')
         else:
             output_handle = args.output
         
         # Perform conversion
-        convert_toggl_to_zoho(input_handle, output_handle)
-        
-        # Flush output if using stdout
-        if output_is_stdout:
-            sys.stdout.flush()
+        converted = False
+        try:
+            convert_toggl_to_zoho(input_handle, output_handle)
+            converted = True
+        finally:
+            # Close reopened streams (this flushes stdout, not the descriptors).
+            # After a failure the read-ahead thread may still be blocked reading
+            # stdin and holding its buffer, so stdin is left for exit to release
+            if converted and input_is_stdin and input_handle is not sys.stdin:
+                input_handle.close()
+            if output_is_stdout:
+                if output_handle is sys.stdout:
+                    sys.stdout.flush()
+                else:
+                    output_handle.close()
         
         # Only print success message if not writing to stdout
         if not output_is_stdout:
@@ -1,15 +1,83 @@
 """Core conversion logic for Toggl to Zoho CSV transformation."""
 
 import csv
-from datetime import time, date, datetime, timedelta
-from typing import Dict, List
+import io
+import os
+import stat
+from contextlib import closing
+from datetime import date
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from os import PathLike
+from typing import (Any, Callable, Dict, Generator, Iterable, Iterator, List, Optional, Sequence,
+                    TextIO, Tuple, Union)
 
+# Zoho output row, ordered as ZOHO_HEADERS
+ZohoRow = Tuple[str, ...]
 
-def required_headers(toggl_reader: csv.DictReader) -> bool:
+# Batches of raw Toggl CSV rows
+Batches = Generator[List[List[str]], None, None]
+
+# CSV input or output: a path or an open text stream
+CsvFile = Union[str, 'PathLike[str]', TextIO]
+
+# Toggl columns that must be present in the export header
+REQUIRED_HEADERS = ('Project', 'Task', 'Description', 'Start date', 'Start time',
+                    'End date', 'End time', 'Duration', 'Tags')
+
+# Toggl columns consumed by the conversion, in the order each row is unpacked
+TOGGL_COLUMNS = ['Project', 'Task', 'Description', 'Email', 'Billable',
+                 'Start date', 'Start time', 'End date', 'End time']
+(PROJECT_IDX, TASK_IDX, DESCRIPTION_IDX, EMAIL_IDX, BILLABLE_IDX,
+ START_DATE_IDX, START_TIME_IDX, END_DATE_IDX, END_TIME_IDX) = range(len(TOGGL_COLUMNS))
+
+# Zoho column for each Toggl column, in Zoho output order
+HEADER_MAP = {
+    'Project': 'Project Name',
+    'Description': 'Notes',
+    'Email': 'Email',
+    'Task': 'Task Name',
+    'Duration': 'Time Spent',
+    'Start time': 'Begin Time',
+    'End time': 'End Time',
+    'Start date': 'Date',
+    'Billable': 'Billable Status',
+}
+
+# Zoho columns written to the output, in order
+ZOHO_HEADERS = list(HEADER_MAP.values())
+
+# Toggl billable values mapped to Zoho billable status (anything else is non-billable)
+BILLABLE_STATUS = {'Yes': 'Billable', 'No': 'Non Billable', '': 'Non Billable'}
+
+# Number of input rows converted and written per batch
+WRITE_BATCH_SIZE = 1024
+
+# Maximum number of batches read ahead of the conversion for pipe input
+READ_AHEAD_BATCHES = 16
+
+# Seconds to wait for a full read-ahead batch before taking the rows read so far
+READ_AHEAD_WAIT = 0.05
+
+# Buffer size in bytes for input and output files
+IO_BUFFER_SIZE = 1 << 20
+
+# Number of distinct start/end time pairs memoized by reformatTimes
+TIME_CACHE_SIZE = 4096
+
+# Number of distinct date strings memoized by dateOrdinal
+DATE_CACHE_SIZE = 1024
+
+# Zero-padded two-digit strings, indexed by value, for formatting times
+TWO_DIGIT = [f"{i:02d}" for i in range(100)]
+
+
+def required_headers(fieldnames: Sequence[str]) -> bool:
     """Validate that all required headers are present in the Toggl CSV.
     
     Args:
-        toggl_reader: CSV DictReader for the Toggl export file
+        fieldnames: Header row of the Toggl export file
         
     Returns:
         True if all required headers are present
@@ -17,19 +85,18 @@ def required_headers(toggl_reader: csv.DictReader) -> bool:
     Raises:
         Exception: If any required header is missing
     """
-    headers = ['Project', 'Task', 'Description', 'Start date', 'Start time', 
-               'End date', 'End time', 'Duration', 'Tags']
-    for header in headers:
-        if header not in toggl_reader.fieldnames:
-            raise Exception(f"Header '{header}' not found in the CSV file.")
+    present = set(fieldnames)
+    missing = [header for header in REQUIRED_HEADERS if header not in present]
+    if missing:
+        raise Exception(f"Header '{missing[0]}' not found in the CSV file.")
     return True
 
 
-def required_data(toggl_row: Dict[str, str]) -> bool:
+def required_data(fields: Sequence[str]) -> bool:
     """Validate that all required data fields are present in a row.
     
     Args:
-        toggl_row: Dictionary representing a single row from Toggl CSV
+        fields: Row values ordered as TOGGL_COLUMNS
         
     Returns:
         True if all required fields have values
@@ -37,17 +104,42 @@ def required_data(toggl_row: Dict[str, str]) -> bool:
     Raises:
         Exception: If any required field is empty
     """
-    required_fields = ['Project', 'Task', 'Start date', 'Start time', 'End date', 'End time']
+    required_fields = [PROJECT_IDX, TASK_IDX, START_DATE_IDX, START_TIME_IDX,
+                       END_DATE_IDX, END_TIME_IDX]
     for field in required_fields:
-        if not toggl_row.get(field):
+        if not fields[field]:
             raise Exception(f"Missing required data in the CSV file.")
     return True
 
 
+def daySeconds(value: str) -> int:
+    """Convert an HH:MM:SS time to seconds since midnight.
+    
+    Args:
+        value: Time in HH:MM:SS format
+        
+    Returns:
+        Number of seconds since midnight
+        
+    Raises:
+        ValueError: If the value is not a valid HH:MM:SS time of day
+    """
+    # The format is fixed, so slice the fields and range-check them instead of strptime;
+    # int() alone would also accept signs, whitespace and non-ASCII digits
+    digits = value[0:2] + value[3:5] + value[6:8]
+    if (len(value) != 8 or value[2] != ':' or value[5] != ':'
+            or not (digits.isascii() and digits.isdigit())):
+        raise ValueError(f"Invalid time {value!r}, expected HH:MM:SS")
+    hours, minutes, seconds = int(value[0:2]), int(value[3:5]), int(value[6:8])
+    if not (hours < 24 and minutes < 60 and seconds < 60):
+        raise ValueError(f"Invalid time {value!r}, expected HH:MM:SS")
+    return hours * 3600 + minutes * 60 + seconds
+
+
 def getDuration(start_time: str, end_time: str) -> str:
     """Calculate duration between two times in HH:MM:SS format.
     
-    Handles midnight crossings by adding a day if end time is before start time.
+    Handles midnight crossings by wrapping the difference modulo one day.
     
     Args:
         start_time: Start time in HH:MM:SS format
@@ -55,22 +147,69 @@ def getDuration(start_time: str, end_time: str) -> str:
         
     Returns:
         Duration string in HH:MM:SS format
+        
+    Raises:
+        ValueError: If either time is not a valid HH:MM:SS time of day
     """
-    start_time_obj = datetime.strptime(start_time, '%H:%M:%S').time()
-    end_time_obj = datetime.strptime(end_time, '%H:%M:%S').time()
-    
-    duration = datetime.combine(datetime.min, end_time_obj) - datetime.combine(datetime.min, start_time_obj)
-    duration = duration + timedelta(days=1) if duration.total_seconds() < 0 else duration
+    # Modulo wraps midnight crossings into the next day without a branch
+    duration = (daySeconds(end_time) - daySeconds(start_time)) % 86400
     
-    hours = duration.seconds // 3600
-    minutes = (duration.seconds // 60) % 60
-    seconds = duration.seconds % 60
+    hours, remainder = divmod(duration, 3600)
+    minutes, seconds = divmod(remainder, 60)
     
-    duration_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    duration_str = TWO_DIGIT[hours] + ":" + TWO_DIGIT[minutes] + ":" + TWO_DIGIT[seconds]
     return duration_str
 
 
-def splitDates(toggl_row: Dict[str, str]) -> List[Dict[str, str]]:
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def dateOrdinal(day: str) -> int:
+    """Parse a YYYY-MM-DD date to its proleptic Gregorian ordinal.
+    
+    Exports cover only a handful of distinct dates, so results are memoized.
+    
+    Args:
+        day: Date in YYYY-MM-DD format
+        
+    Returns:
+        Day ordinal, as returned by date.toordinal()
+    """
+    return date.fromisoformat(day).toordinal()
+
+
+def splitSpan(start_date: str, start_time: str, end_date: str,
+              end_time: str) -> Iterator[Tuple[str, str, str]]:
+    """Yield one (date, start time, end time) segment per day of a time entry.
+    
+    Single-day entries yield a single segment with the dates and times
+    unchanged. Multi-day entries end each day at 23:59:59 and start each
+    following day at 00:00:00.
+    
+    Args:
+        start_date: Start date in YYYY-MM-DD format
+        start_time: Start time in HH:MM:SS format
+        end_date: End date in YYYY-MM-DD format
+        end_time: End time in HH:MM:SS format
+        
+    Yields:
+        Tuples of (YYYY-MM-DD date, start time, end time) for each day covered
+    """
+    # Most entries are single-day, so compare the strings before parsing
+    if start_date == end_date:
+        yield start_date, start_time, end_time
+        return
+    
+    # Walk the days as integer ordinals rather than adding timedeltas
+    first = dateOrdinal(start_date)
+    last = dateOrdinal(end_date)
+    
+    for day in range(first, last):
+        yield date.fromordinal(day).isoformat(), start_time, '23:59:59'
+        start_time = '00:00:00'
+    
+    yield date.fromordinal(max(first, last)).isoformat(), start_time, end_time
+
+
+def splitDates(toggl_row: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Split multi-day time entries into separate single-day entries.
     
     If a time entry spans multiple days (start date != end date), it will be
@@ -82,33 +221,67 @@ def splitDates(toggl_row: Dict[str, str]) -> List[Dict[str, str]]:
     Returns:
         List of dictionaries, one for each day covered by the entry
     """
-    rows = []
-    start_date = datetime.strptime(toggl_row['Start date'], '%Y-%m-%d').date()
-    end_date = datetime.strptime(toggl_row['End date'], '%Y-%m-%d').date()
+    if toggl_row['Start date'] == toggl_row['End date']:
+        return [toggl_row]
     
-    if start_date == end_date:
-        rows.append(toggl_row)
-    else:
-        while start_date < end_date:
-            new_row = toggl_row.copy()
-            new_row['Start date'] = start_date
-            new_row['End date'] = start_date
-            new_row['End time'] = '23:59:59'
-            new_row['Duration'] = getDuration(new_row['Start time'], new_row['End time'])
-            rows.append(new_row)
-            start_date = start_date + timedelta(days=1)
-            toggl_row['Start time'] = '00:00:00'
-        
-        new_row = toggl_row.copy()
-        new_row['Start date'] = start_date
-        new_row['End date'] = start_date
-        new_row['End time'] = toggl_row['End time']
-        new_row['Duration'] = getDuration(new_row['Start time'], new_row['End time'])
-        rows.append(new_row)
+    segments = splitSpan(toggl_row['Start date'], toggl_row['Start time'],
+                         toggl_row['End date'], toggl_row['End time'])
+    # Segments are consecutive days, so build their dates from the first ordinal
+    first = dateOrdinal(toggl_row['Start date'])
+    # Each row is the input row as a template, overlaid with the fields that
+    # change per day, built in a single dict display
+    rows = []
+    for offset, (_, start_time, end_time) in enumerate(segments):
+        day = date.fromordinal(first + offset)
+        rows.append({
+            **toggl_row,
+            'Start date': day,
+            'End date': day,
+            'Start time': start_time,
+            'End time': end_time,
+            'Duration': getDuration(start_time, end_time),
+        })
     
     return rows
 
 
+def minuteDuration(start_time: str, end_time: str) -> str:
+    """Calculate the HH:MM duration between the HH:MM parts of two times.
+    
+    Args:
+        start_time: Start time in HH:MM:SS format
+        end_time: End time in HH:MM:SS format
+        
+    Returns:
+        Duration string in HH:MM format
+        
+    Raises:
+        ValueError: If either time is not a valid HH:MM:SS time of day
+    """
+    # Duration of the HH:MM-truncated times, so seconds are dropped first
+    duration = (daySeconds(end_time) // 60 - daySeconds(start_time) // 60) % 1440
+    hours, minutes = divmod(duration, 60)
+    return TWO_DIGIT[hours] + ":" + TWO_DIGIT[minutes]
+
+
+@lru_cache(maxsize=TIME_CACHE_SIZE)
+def reformatTimes(start_time: str, end_time: str) -> Tuple[str, str, str]:
+    """Convert a start/end pair from HH:MM:SS to HH:MM with an HH:MM duration.
+    
+    Args:
+        start_time: Start time in HH:MM:SS format
+        end_time: End time in HH:MM:SS format
+        
+    Returns:
+        Tuple of (start time, end time, duration), all in HH:MM format
+        
+    Raises:
+        ValueError: If either time is not a valid HH:MM:SS time of day
+    """
+    # HH:MM is just the first five characters of HH:MM:SS
+    return start_time[:5], end_time[:5], minuteDuration(start_time, end_time)
+
+
 def reformatTime(toggl_row: Dict[str, str]) -> Dict[str, str]:
     """Convert time format from HH:MM:SS to HH:MM.
     
@@ -118,17 +291,8 @@ def reformatTime(toggl_row: Dict[str, str]) -> Dict[str, str]:
     Returns:
         Modified toggl_row with reformatted times
     """
-    start_time = time.fromisoformat(toggl_row['Start time'])
-    end_time = time.fromisoformat(toggl_row['End time'])
-    
-    toggl_row['Start time'] = start_time.strftime("%H:%M")
-    toggl_row['End time'] = end_time.strftime("%H:%M")
-    
-    duration = getDuration(toggl_row['Start time'] + ":00", toggl_row['End time'] + ":00")
-    # clip the seconds
-    duration = duration[:5]
-    toggl_row['Duration'] = duration
-    
+    toggl_row['Start time'], toggl_row['End time'], toggl_row['Duration'] = reformatTimes(
+        toggl_row['Start time'], toggl_row['End time'])
     return toggl_row
 
 
@@ -141,10 +305,7 @@ def renameBillable(toggl_row: Dict[str, str]) -> Dict[str, str]:
     Returns:
         Modified toggl_row with converted billable status
     """
-    if toggl_row['Billable'] == 'Yes':
-        toggl_row['Billable'] = 'Billable'
-    else:
-        toggl_row['Billable'] = 'Non Billable'
+    toggl_row['Billable'] = BILLABLE_STATUS.get(toggl_row['Billable'], 'Non Billable')
     return toggl_row
 
 
@@ -157,76 +318,321 @@ def renameHeaders(toggl_row: Dict[str, str]) -> Dict[str, str]:
     Returns:
         Dictionary with Zoho-formatted column names
     """
-    zoho_row = {}
-    zoho_row['Project Name'] = toggl_row['Project']
-    zoho_row['Notes'] = toggl_row['Description']
-    zoho_row['Email'] = toggl_row['Email']
-    zoho_row['Task Name'] = toggl_row['Task']
-    zoho_row['Time Spent'] = toggl_row['Duration']
-    zoho_row['Begin Time'] = toggl_row['Start time']
-    zoho_row['End Time'] = toggl_row['End time']
-    zoho_row['Date'] = toggl_row['Start date']
-    zoho_row['Billable Status'] = toggl_row['Billable']
-    return zoho_row
+    # Spelled out from HEADER_MAP so each key is a constant, not a loop lookup
+    return {
+        'Project Name': toggl_row['Project'],
+        'Notes': toggl_row['Description'],
+        'Email': toggl_row['Email'],
+        'Task Name': toggl_row['Task'],
+        'Time Spent': toggl_row['Duration'],
+        'Begin Time': toggl_row['Start time'],
+        'End Time': toggl_row['End time'],
+        'Date': toggl_row['Start date'],
+        'Billable Status': toggl_row['Billable'],
+    }
 
 
-def convert_toggl_to_zoho(input_file, output_file) -> None:
-    """Convert a Toggl CSV export to Zoho-compatible format.
+def toZohoRow(project: str, description: str, email: str, task: str, billable: str,
+              day: str, start_time: str, end_time: str) -> ZohoRow:
+    """Build one Zoho output row from a Toggl row and one of its day segments.
+    
+    Fuses reformatTime, renameBillable and renameHeaders into a single pass
+    that returns the values in ZOHO_HEADERS order.
+    
+    Args:
+        project: Toggl project name
+        description: Toggl entry description
+        email: Toggl user email
+        task: Toggl task name
+        billable: Toggl billable value (Yes/No)
+        day: Date of the segment in YYYY-MM-DD format
+        start_time: Segment start time in HH:MM:SS format
+        end_time: Segment end time in HH:MM:SS format
+        
+    Returns:
+        Tuple of Zoho column values
+    """
+    # Split segments mostly share the 00:00:00/23:59:59 boundaries, so the
+    # cached time formatting hits often here
+    begin, end, duration = reformatTimes(start_time, end_time)
+    
+    return (
+        project,
+        description,
+        email,
+        task,
+        duration,
+        begin,
+        end,
+        day,
+        BILLABLE_STATUS.get(billable, 'Non Billable'),
+    )
+
+
+def readBatches(toggl_reader: Iterator[List[str]], batch_size: int) -> Batches:
+    """Yield batches of CSV rows read in the calling thread.
+    
+    Args:
+        toggl_reader: CSV reader positioned after the header row
+        batch_size: Number of rows per batch
+        
+    Yields:
+        Non-empty lists of raw rows, in input order
+    """
+    while True:
+        batch = list(islice(toggl_reader, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def readAhead(toggl_reader: Iterator[List[str]], batch_size: int) -> Batches:
+    """Yield batches of CSV rows read by a background thread.
+    
+    The thread reads up to READ_AHEAD_BATCHES batches ahead, so waiting on a
+    slow stream overlaps with converting and writing earlier batches. Rows are
+    handed over as they arrive: a batch is yielded once batch_size rows are
+    waiting, or after READ_AHEAD_WAIT seconds with whatever rows have been
+    read, so a stream that goes quiet is not held up by a partial batch.
+    Errors raised while reading are re-raised in the consuming thread, after
+    the rows read before them.
+    
+    Once the consumer stops early, the thread reads no further rows, but a
+    read already blocked on the stream only returns when data or EOF arrives.
+    Until then the thread still holds the stream, so it must not be closed.
+    
+    Args:
+        toggl_reader: CSV reader positioned after the header row
+        batch_size: Number of rows per full batch
+        
+    Yields:
+        Non-empty lists of raw rows, in input order
+    """
+    # Only pipe input reads ahead, so file conversions and the per-row
+    # helpers don't pay for importing the threading machinery
+    import threading
+    from collections import deque
+    
+    # Rows read but not yet yielded; appends and pops on a deque are thread-safe
+    rows: 'deque[List[str]]' = deque()
+    # Set by the producer once a full batch is waiting, and when it finishes
+    ready = threading.Event()
+    # Set by the consumer after it takes rows, to wake a producer that is too far ahead
+    drained = threading.Event()
+    stop = threading.Event()
+    # Empty while reading, then None at EOF or the error that ended the read
+    finished: List[Optional[BaseException]] = []
+    limit = READ_AHEAD_BATCHES * batch_size
+    
+    def produce() -> None:
+        try:
+            for row in toggl_reader:
+                # Checked per row, so a stopped consumer's stream is left alone
+                # as soon as the read in progress returns
+                if stop.is_set():
+                    return
+                rows.append(row)
+                if len(rows) >= batch_size and not ready.is_set():
+                    ready.set()
+                while len(rows) >= limit and not stop.is_set():
+                    drained.clear()
+                    if len(rows) >= limit:
+                        drained.wait(0.1)
+            finished.append(None)
+        except BaseException as e:
+            finished.append(e)
+        ready.set()
+    
+    # Daemon, so a read blocked on an abandoned stream cannot hold up exit
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            if not finished:
+                ready.wait(READ_AHEAD_WAIT)
+                ready.clear()
+            # Checked before taking rows, so the rows read before the end go first
+            done = bool(finished)
+            batch = [rows.popleft() for _ in range(len(rows))]
+            drained.set()
+            if batch:
+                yield batch
+            elif done:
+                producer.join()
+                if finished[0] is not None:
+                    raise finished[0]
+                return
+    finally:
+        stop.set()
+        drained.set()
+
+
+def isPipe(stream: Any) -> bool:
+    """Check whether a stream reads from a pipe or FIFO.
     
     Args:
-        input_file: File object, path, or string path for the Toggl CSV export
-        output_file: File object, path, or string path for the Zoho CSV output
+        stream: Open file object, or any other iterable of lines
+        
+    Returns:
+        True if the stream has a file descriptor that is a pipe or FIFO
     """
-    # Check if input_file is a file-like object or a path
-    input_is_file_object = hasattr(input_file, 'read')
-    output_is_file_object = hasattr(output_file, 'write')
+    try:
+        return stat.S_ISFIFO(os.fstat(stream.fileno()).st_mode)
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+def convertBatch(toggl_rows: Iterable[Sequence[str]],
+                 select: Callable[[Sequence[str]], Tuple[str, ...]]) -> List[ZohoRow]:
+    """Convert a batch of raw Toggl CSV rows to Zoho output rows.
     
-    # Handle input
-    if input_is_file_object:
+    Args:
+        toggl_rows: Raw rows from the Toggl CSV reader
+        select: Callable returning a row's values ordered as TOGGL_COLUMNS
+        
+    Returns:
+        List of Zoho rows, with multi-day entries split into one row per day
+        
+    Raises:
+        Exception: If any row is missing required data or columns
+    """
+    # Blank lines parse as empty rows and are skipped, as csv.DictReader does;
+    # a row too short for select has lost columns, so its data is missing
+    try:
+        selected = list(map(select, filter(None, toggl_rows)))
+    except IndexError:
+        raise Exception("Missing required data in the CSV file.") from None
+    
+    zoho_rows: List[ZohoRow] = []
+    for fields in selected:
+        # Unpack once so the rest of the row works on locals
+        (project, task, description, email, billable,
+         start_date, start_time, end_date, end_time) = fields
+        
+        # Same check as required_data, short-circuiting on the unpacked values
+        if not (project and task and start_date and start_time and end_date and end_time):
+            raise Exception("Missing required data in the CSV file.")
+        
+        # Fast path for the common single-day entry, skipping the splitSpan call;
+        # its times include seconds and rarely repeat, so it bypasses reformatTimes' cache
+        if start_date == end_date:
+            zoho_rows.append((
+                project,
+                description,
+                email,
+                task,
+                minuteDuration(start_time, end_time),
+                start_time[:5],
+                end_time[:5],
+                start_date,
+                BILLABLE_STATUS.get(billable, 'Non Billable'),
+            ))
+            continue
+        
+        segments = splitSpan(start_date, start_time, end_date, end_time)
+        for day, segment_start, segment_end in segments:
+            zoho_rows.append(toZohoRow(project, description, email, task, billable,
+                                       day, segment_start, segment_end))
+    
+    return zoho_rows
+
+
+def formatRows(zoho_rows: Iterable[ZohoRow]) -> str:
+    """Format Zoho rows as CSV text, quoted exactly as csv.writer would.
+    
+    Only text fields can need quoting, and rarely do, so each row is joined
+    directly and handed to csv.writer only if it contains a special character.
+    
+    Args:
+        zoho_rows: Rows ordered as ZOHO_HEADERS
+        
+    Returns:
+        CSV text with a CRLF after every row
+    """
+    delimiters = len(ZOHO_HEADERS) - 1
+    lines = []
+    for zoho_row in zoho_rows:
+        line = ','.join(zoho_row)
+        if line.count(',') != delimiters or '"' in line or '\n' in line or '\r' in line:
+            quoted = io.StringIO()
+            csv.writer(quoted).writerow(zoho_row)
+            lines.append(quoted.getvalue())
+        else:
+            lines.append(line + '\r\n')
+    return ''.join(lines)
+
+
+def convert_toggl_to_zoho(input_file: CsvFile, output_file: CsvFile) -> None:
+    """Convert a Toggl CSV export to Zoho-compatible format.
+    
+    Args:
+        input_file: File object, path, or string path for the Toggl CSV export.
+            A pipe is read ahead on a background thread; if the conversion
+            fails, that thread may still be blocked reading it (see readAhead).
+        output_file: File object, path, or string path for the Zoho CSV output.
+            A path is only created or replaced once the whole input has converted.
+    """
+    # Handle input (paths are opened here, file objects are used as-is)
+    toggl_file: TextIO
+    if isinstance(input_file, (str, PathLike)):
+        toggl_file = open(input_file, newline='', mode='r', encoding='utf-8-sig',
+                          buffering=IO_BUFFER_SIZE)
+        should_close_input = True
+    else:
         toggl_file = input_file
         should_close_input = False
-    else:
-        toggl_file = open(input_file, newline='', mode='r', encoding='utf-8-sig')
-        should_close_input = True
     
     try:
-        toggl_reader = csv.DictReader(toggl_file)
+        toggl_reader = csv.reader(toggl_file)
+        header = next(toggl_reader, [])
         
-        if not required_headers(toggl_reader):
+        if not required_headers(header):
             return
         
-        zoho_rows = []
-        for toggl_row in toggl_reader:
-            if not required_data(toggl_row):
-                return
-            
-            rows = splitDates(toggl_row)
-            for r in rows:
-                r = reformatTime(r)
-                r = renameBillable(r)
-                zoho_row = renameHeaders(r)
-                zoho_rows.append(zoho_row)
-        
-        # Handle output
-        if output_is_file_object:
+        # Resolve column positions once, then unpack every row positionally
+        idx = {name: i for i, name in enumerate(header)}
+        select = itemgetter(*[idx[name] for name in TOGGL_COLUMNS])
+        
+        # Handle output; paths are written to a partial file next to the
+        # target and only renamed over it once every row has converted
+        zoho_file: TextIO
+        if isinstance(output_file, (str, PathLike)):
+            output_path = os.fspath(output_file)
+            partial_path = f"{output_path}.{os.getpid()}.tmp"
+            zoho_file = open(partial_path, mode='x', newline='', encoding='utf-8',
+                             buffering=IO_BUFFER_SIZE)
+            should_close_output = True
+        else:
             zoho_file = output_file
             should_close_output = False
-        else:
-            zoho_file = open(output_file, mode='w', newline='', encoding='utf-8-sig')
-            should_close_output = True
         
         try:
-            zoho_writer = csv.DictWriter(zoho_file, fieldnames=zoho_rows[0].keys())
-            zoho_writer.writeheader()
-            for zoho_row in zoho_rows:
-                zoho_writer.writerow(zoho_row)
+            zoho_file.write(formatRows([tuple(ZOHO_HEADERS)]))
+            
+            # Convert and write the input in bounded batches as it is read;
+            # pipes are read on a background thread to hide read latency
+            if isPipe(toggl_file):
+                batches = readAhead(toggl_reader, WRITE_BATCH_SIZE)
+            else:
+                batches = readBatches(toggl_reader, WRITE_BATCH_SIZE)
+            
+            with closing(batches):
+                for batch in batches:
+                    zoho_file.write(formatRows(convertBatch(batch, select)))
             
             # Flush file-like objects (don't flush file paths)
-            if output_is_file_object and hasattr(zoho_file, 'flush'):
+            if not should_close_output and hasattr(zoho_file, 'flush'):
                 zoho_file.flush()
-        finally:
+            
+            if should_close_output:
+                zoho_file.close()
+                os.replace(partial_path, output_path)
+        except BaseException:
+            # Never leave a truncated output behind for a failed conversion
             if should_close_output:
                 zoho_file.close()
+                os.remove(partial_path)
+            raise
     
     finally:
         if should_close_input:
@@ -204,7 +204,7 @@ class TestCLIDataIntegrity:
         
         # Generate piped output
         fake_stdout = io.BytesIO()
-        stdout_wrapper = io.TextIOWrapper(fake_stdout, encoding='utf-8-sig', write_through=True)
+        stdout_wrapper = io.TextIOWrapper(fake_stdout, encoding='utf-8', write_through=True)
         
         with patch('sys.stdout', stdout_wrapper):
             with patch('sys.argv', ['toggl-to-zoho', str(input_file), '-']):
@@ -216,7 +216,7 @@ class TestCLIDataIntegrity:
         
         pipe_data = fake_stdout.getvalue()
         
-        # They should be identical (including BOM)
+        # They should be identical (both without a BOM)
         assert file_data == pipe_data
     
     def test_round_trip_through_pipes(self, tmp_path):
@@ -361,6 +361,56 @@ class TestCLIRealWorldSubprocess:
         rows = list(csv.DictReader(io.StringIO(output_data)))
         assert len(rows) == 50
     
+    def test_cli_as_subprocess_pipe_with_bom(self):
+        """Test that a UTF-8 BOM on piped stdin is stripped like file input."""
+        import subprocess
+        import sys
+        
+        tests_dir = Path(__file__).parent
+        input_file = tests_dir / "test-input-toggl.csv"
+        
+        with open(input_file, 'rb') as f:
+            input_data = b'\xef\xbb\xbf' + f.read()
+        
+        result = subprocess.run(
+            [sys.executable, '-m', 'toggl_to_zoho', '-', '-'],
+            input=input_data,
+            capture_output=True
+        )
+        
+        assert result.returncode == 0, f"Command failed: {result.stderr.decode()}"
+        rows = list(csv.DictReader(io.StringIO(result.stdout.decode('utf-8'))))
+        assert len(rows) == 50
+    
+    def test_cli_as_subprocess_pipe_error_with_open_stdin(self):
+        """Test that a bad row exits promptly while the stdin pipe stays open."""
+        import subprocess
+        import sys
+        
+        proc = subprocess.Popen(
+            [sys.executable, '-m', 'toggl_to_zoho', '-', '-'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        try:
+            proc.stdin.write(
+                b"Email,Project,Task,Description,Billable,Start date,Start time,"
+                b"End date,End time,Duration,Tags\n"
+                b"test@example.com,Project Alpha,,Test work,Yes,2025-04-02,10:00:00,"
+                b"2025-04-02,11:00:00,01:00:00,\n"
+            )
+            proc.stdin.flush()
+            
+            # The upstream writer is still attached, like a tail -f producer
+            assert proc.wait(timeout=10) == 1
+            assert 'Missing required data' in proc.stderr.read().decode()
+        finally:
+            proc.kill()
+            proc.stdin.close()
+            proc.stdout.close()
+            proc.stderr.close()
+    
     def test_cli_as_subprocess_version(self):
         """Test --version flag."""
         import subprocess
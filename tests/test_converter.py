@@ -1,38 +1,88 @@
 """Tests for the core conversion logic."""
 
+import csv
+import io
+import threading
+import time
 import pytest
 from datetime import datetime, timedelta
+from operator import itemgetter
 from toggl_to_zoho.converter import (
+    required_data,
+    convertBatch,
+    readAhead,
     getDuration,
     splitDates,
     reformatTime,
     renameBillable,
     renameHeaders,
+    toZohoRow,
+    formatRows,
+    HEADER_MAP,
+    TOGGL_COLUMNS,
+    ZOHO_HEADERS,
 )
 
+# Selects raw rows that are already ordered as TOGGL_COLUMNS
+SELECT_ALL = itemgetter(*range(len(TOGGL_COLUMNS)))
 
-class TestGetDuration:
-    """Tests for duration calculation."""
+VALID_ROW = ['Project Alpha', 'Task A', 'Test work', 'test@example.com', 'Yes',
+             '2025-04-02', '10:00:00', '2025-04-02', '11:00:00']
+
+
+class TestRequiredData:
+    """Tests for required data validation."""
+    
+    def test_valid_row(self):
+        """Test that a row with all required fields passes."""
+        assert required_data(VALID_ROW)
+        assert len(convertBatch([VALID_ROW], SELECT_ALL)) == 1
+    
+    def test_missing_required_data(self):
+        """Test that a row with an empty required field is rejected."""
+        row = VALID_ROW.copy()
+        row[TOGGL_COLUMNS.index('Task')] = ''
+        
+        with pytest.raises(Exception, match="Missing required data"):
+            required_data(row)
+        with pytest.raises(Exception, match="Missing required data"):
+            convertBatch([row], SELECT_ALL)
     
-    def test_simple_duration(self):
-        """Test basic duration calculation."""
-        result = getDuration("10:00:00", "11:30:00")
-        assert result == "01:30:00"
+    def test_short_row(self):
+        """Test that a row with fewer columns than the header is rejected."""
+        with pytest.raises(Exception, match="Missing required data"):
+            convertBatch([VALID_ROW[:3]], SELECT_ALL)
     
-    def test_midnight_crossing(self):
-        """Test duration that crosses midnight."""
-        result = getDuration("23:00:00", "01:00:00")
-        assert result == "02:00:00"
+    def test_blank_rows_are_skipped(self):
+        """Test that empty rows from blank lines produce no output."""
+        assert convertBatch([[], VALID_ROW, []], SELECT_ALL) == convertBatch([VALID_ROW], SELECT_ALL)
+
+
+class TestGetDuration:
+    """Tests for duration calculation."""
     
-    def test_same_time(self):
-        """Test zero duration."""
-        result = getDuration("10:00:00", "10:00:00")
-        assert result == "00:00:00"
+    @pytest.mark.parametrize("start_time,end_time,expected", [
+        pytest.param("10:00:00", "11:30:00", "01:30:00", id="simple_duration"),
+        pytest.param("23:00:00", "01:00:00", "02:00:00", id="midnight_crossing"),
+        pytest.param("10:00:00", "10:00:00", "00:00:00", id="same_time"),
+        pytest.param("00:00:00", "23:59:00", "23:59:00", id="almost_full_day"),
+    ])
+    def test_duration(self, start_time, end_time, expected):
+        """Test duration calculation, including midnight crossings."""
+        assert getDuration(start_time, end_time) == expected
     
-    def test_almost_full_day(self):
-        """Test duration close to 24 hours."""
-        result = getDuration("00:00:00", "23:59:00")
-        assert result == "23:59:00"
+    @pytest.mark.parametrize("start_time,end_time", [
+        pytest.param("25:61:00", "01:15:00", id="out_of_range"),
+        pytest.param("10:00:60", "11:00:00", id="bad_seconds"),
+        pytest.param("10:00", "11:00:00", id="missing_seconds"),
+        pytest.param("+1:00:00", "11:00:00", id="plus_sign"),
+        pytest.param(" 1:00:00", "11:00:00", id="leading_space"),
+        pytest.param("-0:00:00", "11:00:00", id="minus_sign"),
+    ])
+    def test_invalid_time(self, start_time, end_time):
+        """Test that malformed or out-of-range times are rejected."""
+        with pytest.raises(ValueError):
+            getDuration(start_time, end_time)
 
 
 class TestSplitDates:
@@ -114,28 +164,30 @@ class TestReformatTime:
         assert result['Start time'] == '00:00'
         assert result['End time'] == '01:30'
         assert result['Duration'] == '01:30'
+    
+    def test_reformat_invalid_time(self):
+        """Test that out-of-range times are rejected."""
+        row = {
+            'Start time': '25:61:00',
+            'End time': '01:15:00',
+        }
+        with pytest.raises(ValueError):
+            reformatTime(row)
 
 
 class TestRenameBillable:
     """Tests for billable status conversion."""
     
-    def test_yes_to_billable(self):
-        """Test converting 'Yes' to 'Billable'."""
-        row = {'Billable': 'Yes'}
-        result = renameBillable(row)
-        assert result['Billable'] == 'Billable'
-    
-    def test_no_to_non_billable(self):
-        """Test converting 'No' to 'Non Billable'."""
-        row = {'Billable': 'No'}
-        result = renameBillable(row)
-        assert result['Billable'] == 'Non Billable'
-    
-    def test_empty_to_non_billable(self):
-        """Test converting empty string to 'Non Billable'."""
-        row = {'Billable': ''}
+    @pytest.mark.parametrize("billable,expected", [
+        pytest.param('Yes', 'Billable', id="yes_to_billable"),
+        pytest.param('No', 'Non Billable', id="no_to_non_billable"),
+        pytest.param('', 'Non Billable', id="empty_to_non_billable"),
+    ])
+    def test_billable_status(self, billable, expected):
+        """Test converting Yes/No/empty to Zoho billable status."""
+        row = {'Billable': billable}
         result = renameBillable(row)
-        assert result['Billable'] == 'Non Billable'
+        assert result['Billable'] == expected
 
 
 class TestRenameHeaders:
@@ -166,3 +218,103 @@ class TestRenameHeaders:
         assert zoho_row['End Time'] == '11:30'
         assert zoho_row['Date'] == '2025-04-02'
         assert zoho_row['Billable Status'] == 'Billable'
+    
+    def test_header_mapping_matches_header_map(self):
+        """Test that renameHeaders follows HEADER_MAP in Zoho column order."""
+        toggl_row = {toggl: toggl for toggl in HEADER_MAP}
+        
+        zoho_row = renameHeaders(toggl_row)
+        
+        assert list(zoho_row) == ZOHO_HEADERS
+        assert zoho_row == {zoho: toggl for toggl, zoho in HEADER_MAP.items()}
+
+
+class TestToZohoRow:
+    """Tests for the fused Toggl to Zoho row conversion."""
+    
+    def test_zoho_row(self):
+        """Test that a segment is converted to Zoho column order."""
+        zoho_row = toZohoRow('Project Alpha', 'Test work', 'test@example.com', 'Task A', 'Yes',
+                             '2025-04-02', '10:30:45', '11:45:30')
+        
+        assert zoho_row == ('Project Alpha', 'Test work', 'test@example.com', 'Task A',
+                            '01:15', '10:30', '11:45', '2025-04-02', 'Billable')
+    
+    def test_zoho_row_non_billable(self):
+        """Test that anything other than 'Yes' is Non Billable."""
+        zoho_row = toZohoRow('Project Alpha', '', '', 'Task A', 'No',
+                             '2025-04-08', '23:00:00', '23:59:59')
+        
+        assert zoho_row[4] == '00:59'
+        assert zoho_row[8] == 'Non Billable'
+
+
+class TestFormatRows:
+    """Tests for CSV formatting of Zoho rows."""
+    
+    def test_matches_csv_writer(self):
+        """Test that plain and special-character fields are quoted like csv.writer."""
+        rows = [
+            ('Project Alpha', 'Test work', 'a@example.com', 'Task A',
+             '01:30', '10:00', '11:30', '2025-04-02', 'Billable'),
+            ('Project, Beta', 'Said "hi"', 'a@example.com', 'Task\nB',
+             '00:15', '12:00', '12:15', '2025-04-02', 'Non Billable'),
+            ('', 'Line\r\nbreak', '', '', '00:00', '00:00', '00:00', '2025-04-03', 'Billable'),
+        ]
+        expected = io.StringIO()
+        csv.writer(expected).writerows(rows)
+        
+        assert formatRows(rows) == expected.getvalue()
+
+
+class TestReadAhead:
+    """Tests for reading batches on a background thread."""
+    
+    def test_rows_are_batched_in_order(self):
+        """Test that every row is yielded once, in input order."""
+        rows = [[str(i)] for i in range(10)]
+        
+        batches = list(readAhead(iter(rows), 3))
+        
+        assert all(batches)
+        assert [row for batch in batches for row in batch] == rows
+    
+    def test_read_error_follows_earlier_rows(self):
+        """Test that rows read before an error are yielded before it is raised."""
+        def toggl_rows():
+            yield ['first']
+            raise OSError("read failed")
+        
+        batches = readAhead(toggl_rows(), 100)
+        
+        assert next(batches) == [['first']]
+        with pytest.raises(OSError, match="read failed"):
+            next(batches)
+    
+    def test_partial_batch_while_reader_blocks(self):
+        """Test that rows already read are handed on while the next read blocks."""
+        release = threading.Event()
+        reads = []
+        
+        def toggl_rows():
+            reads.append(1)
+            yield ['first']
+            release.wait()
+            reads.append(2)
+            yield ['second']
+            reads.append(3)
+            yield ['third']
+        
+        batches = readAhead(toggl_rows(), 100)
+        assert next(batches) == [['first']]
+        
+        # The consumer stops while the reader is blocked; once that read
+        # returns, no further rows are read
+        batches.close()
+        release.set()
+        deadline = time.monotonic() + 5
+        while len(reads) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.1)
+        assert reads == [1, 2]
+
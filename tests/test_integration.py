@@ -1,7 +1,12 @@
 """Integration tests using real CSV files."""
 
 import csv
+import io
+import os
+import threading
+import time
 from pathlib import Path
+import pytest
 from toggl_to_zoho.converter import convert_toggl_to_zoho
 
 
@@ -11,67 +16,270 @@ def test_full_conversion():
     tests_dir = Path(__file__).parent
     input_file = tests_dir / "test-input-toggl.csv"
     expected_output = tests_dir / "test-output-zoho.csv"
-    actual_output = tests_dir / "test-output-actual.csv"
     
     # Skip if test files don't exist
     if not input_file.exists() or not expected_output.exists():
         return
     
-    try:
-        # Run conversion
-        convert_toggl_to_zoho(str(input_file), str(actual_output))
-        
-        # Read both files and compare
-        with open(expected_output, encoding='utf-8-sig') as f:
-            expected_reader = csv.DictReader(f)
-            expected_rows = list(expected_reader)
-        
-        with open(actual_output, encoding='utf-8-sig') as f:
-            actual_reader = csv.DictReader(f)
-            actual_rows = list(actual_reader)
-        
-        # Compare row count
-        assert len(actual_rows) == len(expected_rows), \
-            f"Row count mismatch: expected {len(expected_rows)}, got {len(actual_rows)}"
-        
-        # Compare each row
+    # Run conversion into memory
+    actual_output = io.StringIO()
+    convert_toggl_to_zoho(str(input_file), actual_output)
+    
+    # Read both outputs as plain rows (header included) so column order is checked too
+    with open(expected_output, newline='', encoding='utf-8-sig') as f:
+        expected_rows = list(csv.reader(f))
+    
+    actual_output.seek(0)
+    actual_rows = list(csv.reader(actual_output))
+    
+    # Compare row count
+    assert len(actual_rows) == len(expected_rows), \
+        f"Row count mismatch: expected {len(expected_rows)}, got {len(actual_rows)}"
+    
+    # Compare everything at once, then report the first mismatching row
+    if actual_rows != expected_rows:
         for i, (expected, actual) in enumerate(zip(expected_rows, actual_rows)):
             assert expected == actual, \
-                f"Row {i+1} mismatch:\nExpected: {expected}\nActual: {actual}"
-    finally:
-        # Clean up - always runs even if test fails
-        if actual_output.exists():
-            actual_output.unlink()
+                f"Row {i} mismatch:\nExpected: {expected}\nActual: {actual}"
 
 
 def test_midnight_crossing_entry():
     """Test that midnight-crossing entries are properly split."""
     tests_dir = Path(__file__).parent
     input_file = tests_dir / "test-input-toggl.csv"
-    output_file = tests_dir / "test-output-actual.csv"
     
     if not input_file.exists():
         return
     
+    output = io.StringIO()
+    convert_toggl_to_zoho(str(input_file), output)
+    
+    # Read output and check for the split midnight entry
+    output.seek(0)
+    reader = csv.DictReader(output)
+    rows = list(reader)
+    
+    # Find entries that span midnight (2025-04-08 23:56 -> 2025-04-09 01:16)
+    # These should be split into multiple entries
+    midnight_entries = [r for r in rows if 
+                       r['Date'] in ('2025-04-08', '2025-04-09') and 
+                       r['Notes'] == 'Tool configuration']
+    
+    # Should have entries on both days
+    dates = {r['Date'] for r in midnight_entries}
+    assert '2025-04-08' in dates
+    assert '2025-04-09' in dates
+
+
+def test_reordered_columns():
+    """Test that column positions are resolved from the header row."""
+    toggl_csv = io.StringIO(
+        "Tags,End time,End date,Start time,Start date,Duration,Billable,"
+        "Description,Task,Project,Email\n"
+        "Research,11:30:00,2025-04-02,10:00:00,2025-04-02,01:30:00,Yes,"
+        "Test work,Task A,Project Alpha,test@example.com\n"
+    )
+    zoho_csv = io.StringIO()
+    
+    convert_toggl_to_zoho(toggl_csv, zoho_csv)
+    
+    zoho_csv.seek(0)
+    rows = list(csv.DictReader(zoho_csv))
+    assert rows == [{
+        'Project Name': 'Project Alpha',
+        'Notes': 'Test work',
+        'Email': 'test@example.com',
+        'Task Name': 'Task A',
+        'Time Spent': '01:30',
+        'Begin Time': '10:00',
+        'End Time': '11:30',
+        'Date': '2025-04-02',
+        'Billable Status': 'Billable',
+    }]
+
+
+def test_stream_matches_file_conversion():
+    """Test that file object input converts the same as a file path."""
+    tests_dir = Path(__file__).parent
+    input_file = tests_dir / "test-input-toggl.csv"
+    
+    file_output = io.StringIO()
+    convert_toggl_to_zoho(str(input_file), file_output)
+    
+    stream_output = io.StringIO()
+    with open(input_file, newline='', encoding='utf-8-sig') as toggl_file:
+        convert_toggl_to_zoho(toggl_file, stream_output)
+    
+    assert stream_output.getvalue() == file_output.getvalue()
+
+
+def test_pipe_matches_file_conversion():
+    """Test that read-ahead pipe input converts the same as a file path."""
+    tests_dir = Path(__file__).parent
+    input_file = tests_dir / "test-input-toggl.csv"
+    
+    file_output = io.StringIO()
+    convert_toggl_to_zoho(str(input_file), file_output)
+    
+    def write_input(fd):
+        with open(fd, 'wb') as toggl_pipe:
+            toggl_pipe.write(input_file.read_bytes())
+    
+    read_fd, write_fd = os.pipe()
+    writer = threading.Thread(target=write_input, args=(write_fd,))
+    writer.start()
+    pipe_output = io.StringIO()
+    with open(read_fd, newline='', encoding='utf-8-sig') as toggl_file:
+        convert_toggl_to_zoho(toggl_file, pipe_output)
+    writer.join()
+    
+    assert pipe_output.getvalue() == file_output.getvalue()
+
+
+def test_pipe_failure_while_reader_blocked():
+    """Test that a bad row is reported while the pipe is still open for writing."""
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, (
+        "Email,Project,Task,Description,Billable,Start date,Start time,"
+        "End date,End time,Duration,Tags\n"
+        "test@example.com,Project Alpha,,Test work,Yes,2025-04-02,10:00:00,"
+        "2025-04-02,11:00:00,01:00:00,\n"
+    ).encode())
+    # Closing the write end unblocks the reader, so a hang fails instead of freezing
+    watchdog = threading.Timer(5, os.close, (write_fd,))
+    watchdog.start()
+    
     try:
-        convert_toggl_to_zoho(str(input_file), str(output_file))
-        
-        # Read output and check for the split midnight entry
-        with open(output_file, encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-        
-        # Find entries that span midnight (2025-04-08 23:56 -> 2025-04-09 01:16)
-        # These should be split into multiple entries
-        midnight_entries = [r for r in rows if 
-                           r['Date'] in ('2025-04-08', '2025-04-09') and 
-                           r['Notes'] == 'Tool configuration']
-        
-        # Should have entries on both days
-        dates = {r['Date'] for r in midnight_entries}
-        assert '2025-04-08' in dates
-        assert '2025-04-09' in dates
+        with open(read_fd, newline='', encoding='utf-8-sig') as toggl_file:
+            started = time.monotonic()
+            with pytest.raises(Exception, match="Missing required data"):
+                convert_toggl_to_zoho(toggl_file, io.StringIO())
+            elapsed = time.monotonic() - started
+            
+            # Let the blocked read-ahead thread see EOF before the file is closed
+            if watchdog.is_alive():
+                watchdog.cancel()
+                os.close(write_fd)
     finally:
-        # Clean up - always runs even if test fails
-        if output_file.exists():
-            output_file.unlink()
+        watchdog.cancel()
+    
+    assert elapsed < 2
+
+
+def test_stream_read_error_is_raised():
+    """Test that an error while reading a stream is raised to the caller."""
+    def toggl_lines():
+        yield ("Email,Project,Task,Description,Billable,Start date,Start time,"
+               "End date,End time,Duration,Tags\n")
+        raise OSError("read failed")
+    
+    with pytest.raises(OSError, match="read failed"):
+        convert_toggl_to_zoho(toggl_lines(), io.StringIO())
+
+
+def test_failed_conversion_leaves_no_output(tmp_path):
+    """Test that a bad row after good rows leaves no partial output file."""
+    input_file = tmp_path / "input.csv"
+    input_file.write_text(
+        "Email,Project,Task,Description,Billable,Start date,Start time,"
+        "End date,End time,Duration,Tags\n"
+        "test@example.com,Project Alpha,Task A,Test work,Yes,2025-04-02,10:00:00,"
+        "2025-04-02,11:00:00,01:00:00,\n"
+        "test@example.com,Project Alpha,,Test work,Yes,2025-04-02,12:00:00,"
+        "2025-04-02,13:00:00,01:00:00,\n"
+    )
+    output_file = tmp_path / "output.csv"
+    
+    with pytest.raises(Exception, match="Missing required data"):
+        convert_toggl_to_zoho(str(input_file), str(output_file))
+    
+    assert list(tmp_path.iterdir()) == [input_file]
+
+
+def test_failed_conversion_keeps_existing_output(tmp_path):
+    """Test that a failed conversion leaves an existing output file untouched."""
+    input_file = tmp_path / "input.csv"
+    input_file.write_text(
+        "Email,Project,Task,Description,Billable,Start date,Start time,"
+        "End date,End time,Duration,Tags\n"
+        "test@example.com,Project Alpha,Task A,Test work,Yes,2025-04-02,25:00:00,"
+        "2025-04-02,11:00:00,01:00:00,\n"
+    )
+    output_file = tmp_path / "output.csv"
+    output_file.write_text("previous output\n")
+    
+    with pytest.raises(ValueError):
+        convert_toggl_to_zoho(str(input_file), str(output_file))
+    
+    assert output_file.read_text() == "previous output\n"
+    assert sorted(tmp_path.iterdir()) == [input_file, output_file]
+
+
+def test_output_has_no_bom(tmp_path):
+    """Test that file output is plain UTF-8 without a byte order mark."""
+    tests_dir = Path(__file__).parent
+    input_file = tests_dir / "test-input-toggl.csv"
+    output_file = tmp_path / "output.csv"
+    
+    convert_toggl_to_zoho(str(input_file), str(output_file))
+    
+    assert output_file.read_bytes().startswith(b'Project Name,')
+
+
+def test_input_with_bom(tmp_path):
+    """Test that a leading UTF-8 BOM on an input file is skipped."""
+    tests_dir = Path(__file__).parent
+    input_file = tmp_path / "input-with-bom.csv"
+    input_file.write_bytes(b'\xef\xbb\xbf' + (tests_dir / "test-input-toggl.csv").read_bytes())
+    
+    expected_output = io.StringIO()
+    convert_toggl_to_zoho(str(tests_dir / "test-input-toggl.csv"), expected_output)
+    
+    actual_output = io.StringIO()
+    convert_toggl_to_zoho(str(input_file), actual_output)
+    
+    assert actual_output.getvalue() == expected_output.getvalue()
+
+
+def test_blank_lines_are_skipped(tmp_path):
+    """Test that blank lines, including an extra trailing newline, are ignored."""
+    tests_dir = Path(__file__).parent
+    input_file = tmp_path / "input-with-blank-lines.csv"
+    input_file.write_bytes((tests_dir / "test-input-toggl.csv").read_bytes() + b'\n')
+    
+    expected_output = io.StringIO()
+    convert_toggl_to_zoho(str(tests_dir / "test-input-toggl.csv"), expected_output)
+    
+    actual_output = io.StringIO()
+    convert_toggl_to_zoho(str(input_file), actual_output)
+    
+    assert actual_output.getvalue() == expected_output.getvalue()
+
+
+def test_cr_line_endings(tmp_path):
+    """Test that an input file with CR-only line endings converts the same."""
+    tests_dir = Path(__file__).parent
+    input_bytes = (tests_dir / "test-input-toggl.csv").read_bytes()
+    input_file = tmp_path / "input-cr.csv"
+    input_file.write_bytes(input_bytes.replace(b'\r\n', b'\n').replace(b'\n', b'\r'))
+    
+    expected_output = io.StringIO()
+    convert_toggl_to_zoho(str(tests_dir / "test-input-toggl.csv"), expected_output)
+    
+    actual_output = io.StringIO()
+    convert_toggl_to_zoho(str(input_file), actual_output)
+    
+    assert actual_output.getvalue() == expected_output.getvalue()
+
+
+def test_invalid_time_is_rejected():
+    """Test that an out-of-range time on a single-day entry is rejected."""
+    toggl_csv = io.StringIO(
+        "Email,Project,Task,Description,Billable,Start date,Start time,"
+        "End date,End time,Duration,Tags\n"
+        "test@example.com,Project Alpha,Task A,Test work,Yes,2025-04-02,25:61:00,"
+        "2025-04-02,01:15:00,01:00:00,\n"
+    )
+    
+    with pytest.raises(ValueError, match="Invalid time"):
+        convert_toggl_to_zoho(toggl_csv, io.StringIO())